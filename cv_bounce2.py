@@ -4,8 +4,10 @@ import numpy as np
 from PIL import Image
 import cv2
 
+from display_list import DisplayList
+import startup_cache
+
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
-from adafruit_blinka_raspberry_pi5_piomatter.pixelmappers import simple_multilane_mapper
 
 # --- 하드웨어 설정 ---
 panel_width = 64
@@ -29,7 +31,7 @@ def apply_rotation_fix(original_image, lane_height, num_lanes):
     return corrected_img
 
 # --- PioMatter 매트릭스 초기화 ---
-pixelmap = simple_multilane_mapper(width, height, n_addr_lines, n_lanes_for_mapper)
+pixelmap = startup_cache.pixelmap(width, height, n_addr_lines, n_lanes_for_mapper).tolist()
 geometry = piomatter.Geometry(
     width=width, 
     height=height, 
@@ -55,6 +57,35 @@ ball_speed_y = 3.0
 ball_radius = 10
 ball_color = (0, 215, 255)  # GOLD in BGR (OpenCV uses BGR!)
 
+# --- 장면 구성 (디스플레이 리스트: 정적 도형은 한 번만 그려서 캐시) ---
+scene = DisplayList(width, height)
+
+# 1. 상단에 텍스트 추가
+scene.text("Fantasy Inventory - ACC Children", (10, 15), (255, 255, 255),
+           cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1, cv2.LINE_AA)
+
+# 2. 테두리 사각형
+scene.rectangle((2, 2), (width-3, height-3), (0, 255, 0), 2)
+
+# 3. 중앙 십자선
+scene.line((width//2, 0), (width//2, height), (50, 50, 50), 1)
+scene.line((0, height//2), (width, height//2), (50, 50, 50), 1)
+
+# 4. 하단에 작은 사각형들
+scene.rectangle((20, height-25), (50, height-10), (255, 0, 0), -1)
+scene.rectangle((60, height-25), (90, height-10), (0, 255, 0), -1)
+scene.rectangle((100, height-25), (130, height-10), (0, 0, 255), -1)
+
+# 5. 우상단에 작은 원
+scene.circle((width-20, 20), 8, (255, 0, 255), 2)
+
+# 6. 대각선
+scene.line((0, 0), (50, 50), (128, 128, 0), 2)
+
+# 공 (매 프레임 바뀌는 동적 도형)
+scene.circle((int(ball_x), int(ball_y)), ball_radius, ball_color, -1, name="ball")
+scene.compile()
+
 print(f"Starting animation on {width}x{height} matrix.")
 print("Press Ctrl-C to exit.")
 
@@ -70,35 +101,9 @@ try:
         if ball_y >= (height - ball_radius) or ball_y <= ball_radius:
             ball_speed_y *= -1.0
         
-        # 화면 지우기 (검은색)
-        temp_buffer = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # === 텍스트 및 도형 추가 ===
-        
-        # 1. 상단에 텍스트 추가
-        cv2.putText(temp_buffer, "Fantasy Inventory - ACC Children", (10, 15), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
-        
-        # 2. 테두리 사각형
-        cv2.rectangle(temp_buffer, (2, 2), (width-3, height-3), (0, 255, 0), 2)
-        
-        # 3. 중앙 십자선
-        cv2.line(temp_buffer, (width//2, 0), (width//2, height), (50, 50, 50), 1)
-        cv2.line(temp_buffer, (0, height//2), (width, height//2), (50, 50, 50), 1)
-        
-        # 4. 하단에 작은 사각형들
-        cv2.rectangle(temp_buffer, (20, height-25), (50, height-10), (255, 0, 0), -1)
-        cv2.rectangle(temp_buffer, (60, height-25), (90, height-10), (0, 255, 0), -1)
-        cv2.rectangle(temp_buffer, (100, height-25), (130, height-10), (0, 0, 255), -1)
-        
-        # 5. 우상단에 작은 원
-        cv2.circle(temp_buffer, (width-20, 20), 8, (255, 0, 255), 2)
-        
-        # 6. 대각선
-        cv2.line(temp_buffer, (0, 0), (50, 50), (128, 128, 0), 2)
-        
-        # === 공 그리기 (기존) ===
-        cv2.circle(temp_buffer, (int(ball_x), int(ball_y)), ball_radius, ball_color, -1)
+        # 공 위치만 갱신 (나머지 도형은 컴파일된 정적 래스터에서 그대로 재사용)
+        scene.update("ball", center=(int(ball_x), int(ball_y)))
+        temp_buffer = scene.render()
         
         # OpenCV는 BGR, PIL은 RGB이므로 변환
         temp_buffer_rgb = cv2.cvtColor(temp_buffer, cv2.COLOR_BGR2RGB)
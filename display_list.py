@@ -0,0 +1,198 @@
+#!/usr/bin/python3
+"""
+매 프레임 같은 인자로 반복되는 cv2 도형 호출을 한 번만 컴파일하는 디스플레이 리스트.
+
+- 이름 없이 추가한 도형(정적)은 compile() 시점에 배경 래스터 하나로 구워서 캐시합니다.
+- 이름을 붙여 추가한 도형(동적)은 update()로 인자를 바꿀 수 있고,
+  render()는 바뀐 도형이 덮는 영역만 정적 래스터에서 복원한 뒤 다시 그립니다.
+- 동적 도형은 항상 모든 정적 도형 위에 그려집니다. (추가한 순서와 무관)
+  동적 도형끼리는 추가한 순서대로 그립니다.
+- 동적 도형의 영역은 추가/갱신할 때 한 번만 계산해두므로, 프레임당 비용은
+  바뀐 도형과 거기에 겹치는 도형 수에 비례합니다.
+
+사용 예:
+    scene = DisplayList(width, height)
+    scene.rectangle((2, 2), (width - 3, height - 3), (0, 255, 0), 2)
+    scene.circle((x, y), 10, (0, 215, 255), -1, name="ball")
+    while True:
+        scene.update("ball", center=(x, y))
+        frame = scene.render()   # BGR, 다음 render() 전까지 수정하지 말 것
+"""
+import numpy as np
+import cv2
+
+
+class DisplayList:
+    def __init__(self, width, height, background=(0, 0, 0)):
+        self.width = width
+        self.height = height
+        self.background = tuple(background)
+
+        self._static = []    # [(kind, params), ...] 추가 순서대로
+        self._dynamic = {}   # name -> (kind, params), dict는 추가 순서를 유지
+        self._order = {}     # name -> 추가 순번 (다시 그릴 때 정렬용)
+        self._boxes = {}     # name -> 현재 인자로 그렸을 때의 영역 (x0, y0, x1, y1)
+        self._dirty = set()
+
+        self._base = None    # 정적 도형을 구운 래스터 캐시
+        self._frame = None   # 마지막으로 렌더링한 프레임
+        self._drawn = {}     # name -> 마지막으로 그린 영역 (x0, y0, x1, y1)
+
+    # --- 도형 추가 ---
+    def rectangle(self, pt1, pt2, color, thickness=1, line_type=cv2.LINE_8, name=None):
+        self._add("rectangle", dict(pt1=pt1, pt2=pt2, color=color,
+                                    thickness=thickness, line_type=line_type), name)
+
+    def line(self, pt1, pt2, color, thickness=1, line_type=cv2.LINE_8, name=None):
+        self._add("line", dict(pt1=pt1, pt2=pt2, color=color,
+                               thickness=thickness, line_type=line_type), name)
+
+    def circle(self, center, radius, color, thickness=1, line_type=cv2.LINE_8, name=None):
+        self._add("circle", dict(center=center, radius=radius, color=color,
+                                 thickness=thickness, line_type=line_type), name)
+
+    def text(self, text, org, color, font_face=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.5,
+             thickness=1, line_type=cv2.LINE_8, name=None):
+        self._add("text", dict(text=text, org=org, color=color, font_face=font_face,
+                               font_scale=font_scale, thickness=thickness,
+                               line_type=line_type), name)
+
+    def _add(self, kind, params, name):
+        if name is None:
+            # 정적 도형이 바뀌면 구워둔 래스터를 다시 만들어야 합니다.
+            self._static.append((kind, params))
+            self._base = None
+            return
+        if name in self._dynamic:
+            raise ValueError(f"duplicate primitive name: {name!r}")
+        self._dynamic[name] = (kind, params)
+        self._order[name] = len(self._order)
+        self._boxes[name] = _clip(_bbox(kind, params), self.width, self.height)
+        self._dirty.add(name)
+
+    # --- 동적 도형 갱신 ---
+    def update(self, name, **changes):
+        """
+        동적 도형의 인자를 바꿉니다. 값이 실제로 바뀐 경우에만 다시 그려집니다.
+
+        Args:
+            name: 도형을 추가할 때 지정한 이름
+            **changes: 바꿀 인자 (예: center=(x, y), color=(255, 0, 0))
+        """
+        kind, params = self._dynamic[name]
+        unknown = set(changes) - set(params)
+        if unknown:
+            raise TypeError(f"{kind} has no parameter(s): {', '.join(sorted(unknown))}")
+        if any(params[k] != v for k, v in changes.items()):
+            params = {**params, **changes}
+            self._dynamic[name] = (kind, params)
+            self._boxes[name] = _clip(_bbox(kind, params), self.width, self.height)
+            self._dirty.add(name)
+
+    # --- 컴파일 / 렌더링 ---
+    def compile(self):
+        """정적 도형을 배경 래스터 하나로 굽습니다. 다음 render()는 전체를 다시 그립니다."""
+        base = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        base[:, :] = self.background
+        for kind, params in self._static:
+            _draw(base, kind, params)
+        self._base = base
+        self._frame = None
+
+    def render(self):
+        """
+        현재 장면을 그린 BGR 프레임을 돌려줍니다.
+
+        바뀐 동적 도형이 없으면 이전 프레임을 그대로 돌려주고, 있으면 그 도형의
+        이전/현재 영역과 거기에 겹치는 동적 도형만 다시 그립니다.
+        """
+        if self._base is None:
+            self.compile()
+
+        if self._frame is not None and not self._dirty:
+            return self._frame
+
+        if self._frame is None:
+            self._frame = self._base.copy()
+            redraw = list(self._dynamic)
+        elif len(self._dirty) * 2 >= len(self._dynamic):
+            # 동적 도형 대부분이 바뀌었으면 겹침 계산 없이 전부 다시 그리는 편이 빠릅니다.
+            np.copyto(self._frame, self._base)
+            redraw = list(self._dynamic)
+        else:
+            regions = []
+            for name in self._dirty:
+                if name in self._drawn:
+                    regions.append(self._drawn[name])
+                regions.append(self._boxes[name])
+            redraw = self._expand(regions)
+            for x0, y0, x1, y1 in regions:
+                self._frame[y0:y1, x0:x1] = self._base[y0:y1, x0:x1]
+
+        for name in redraw:
+            kind, params = self._dynamic[name]
+            _draw(self._frame, kind, params)
+            self._drawn[name] = self._boxes[name]
+        self._dirty.clear()
+        return self._frame
+
+    def _expand(self, regions):
+        # 복원할 영역에 걸친 도형은 전부 다시 그려야 하고, 그 도형이 덮는 영역도
+        # 복원 대상이 되므로 더 늘어나지 않을 때까지 반복합니다. (regions를 제자리에서 늘림)
+        # 매 단계에서는 직전 단계에 새로 추가된 영역하고만 비교합니다.
+        redraw = set()
+        frontier = list(regions)
+        while frontier:
+            added = []
+            for name, box in self._boxes.items():
+                if name not in redraw and any(_intersects(box, r) for r in frontier):
+                    redraw.add(name)
+                    added.append(box)
+            regions.extend(added)
+            frontier = added
+        return sorted(redraw, key=self._order.__getitem__)
+
+
+# --- 도형별 그리기 / 영역 계산 ---
+def _draw(canvas, kind, p):
+    if kind == "rectangle":
+        cv2.rectangle(canvas, p["pt1"], p["pt2"], p["color"], p["thickness"], p["line_type"])
+    elif kind == "line":
+        cv2.line(canvas, p["pt1"], p["pt2"], p["color"], p["thickness"], p["line_type"])
+    elif kind == "circle":
+        cv2.circle(canvas, p["center"], p["radius"], p["color"], p["thickness"], p["line_type"])
+    elif kind == "text":
+        cv2.putText(canvas, p["text"], p["org"], p["font_face"], p["font_scale"],
+                    p["color"], p["thickness"], p["line_type"])
+    else:
+        raise ValueError(f"unknown primitive kind: {kind!r}")
+
+
+def _bbox(kind, p):
+    # 선 두께와 안티에일리어싱 번짐까지 넉넉하게 포함한 (x0, y0, x1, y1), x1/y1은 미포함
+    pad = max(p["thickness"], 0) // 2 + 1
+    if p["line_type"] == cv2.LINE_AA:
+        pad += 1
+
+    if kind in ("rectangle", "line"):
+        (ax, ay), (bx, by) = p["pt1"], p["pt2"]
+        return (min(ax, bx) - pad, min(ay, by) - pad, max(ax, bx) + pad + 1, max(ay, by) + pad + 1)
+    if kind == "circle":
+        (cx, cy), r = p["center"], p["radius"] + pad
+        return (cx - r, cy - r, cx + r + 1, cy + r + 1)
+    if kind == "text":
+        (tw, th), baseline = cv2.getTextSize(p["text"], p["font_face"], p["font_scale"], p["thickness"])
+        ox, oy = p["org"]
+        return (ox - pad, oy - th - pad, ox + tw + pad + 1, oy + baseline + pad + 1)
+    raise ValueError(f"unknown primitive kind: {kind!r}")
+
+
+def _clip(box, width, height):
+    x0, y0, x1, y1 = box
+    x0, y0 = min(max(x0, 0), width), min(max(y0, 0), height)
+    x1, y1 = min(max(x1, x0), width), min(max(y1, y0), height)
+    return (x0, y0, x1, y1)
+
+
+def _intersects(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
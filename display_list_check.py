@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+"""
+DisplayList 검증용 스크립트 (매트릭스 하드웨어 없이 실행 가능).
+
+cv_bounce2.py의 장면을 300프레임 동안 재생하면서, 디스플레이 리스트의 render() 결과가
+매 프레임 cv2로 전부 다시 그린 결과와 픽셀 단위로 같은지 비교하고,
+프레임당 시간이 전부 다시 그리는 것보다 짧은지도 확인합니다.
+"""
+import sys
+import time
+import numpy as np
+import cv2
+
+from display_list import DisplayList
+
+width, height = 256, 96
+ball_radius = 10
+ball_color = (0, 215, 255)
+n_frames = 300
+
+
+# --- 기존 방식: 매 프레임 전부 다시 그리기 (cv_bounce2.py 원래 루프와 동일) ---
+def full_redraw(ball_x, ball_y):
+    temp_buffer = np.zeros((height, width, 3), dtype=np.uint8)
+    cv2.putText(temp_buffer, "Fantasy Inventory - ACC Children", (10, 15),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+    cv2.rectangle(temp_buffer, (2, 2), (width-3, height-3), (0, 255, 0), 2)
+    cv2.line(temp_buffer, (width//2, 0), (width//2, height), (50, 50, 50), 1)
+    cv2.line(temp_buffer, (0, height//2), (width, height//2), (50, 50, 50), 1)
+    cv2.rectangle(temp_buffer, (20, height-25), (50, height-10), (255, 0, 0), -1)
+    cv2.rectangle(temp_buffer, (60, height-25), (90, height-10), (0, 255, 0), -1)
+    cv2.rectangle(temp_buffer, (100, height-25), (130, height-10), (0, 0, 255), -1)
+    cv2.circle(temp_buffer, (width-20, 20), 8, (255, 0, 255), 2)
+    cv2.line(temp_buffer, (0, 0), (50, 50), (128, 128, 0), 2)
+    cv2.circle(temp_buffer, (int(ball_x), int(ball_y)), ball_radius, ball_color, -1)
+    return temp_buffer
+
+
+# --- 디스플레이 리스트 방식 (cv_bounce2.py 장면 구성과 동일) ---
+def build_scene(ball_x, ball_y):
+    scene = DisplayList(width, height)
+    scene.text("Fantasy Inventory - ACC Children", (10, 15), (255, 255, 255),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1, cv2.LINE_AA)
+    scene.rectangle((2, 2), (width-3, height-3), (0, 255, 0), 2)
+    scene.line((width//2, 0), (width//2, height), (50, 50, 50), 1)
+    scene.line((0, height//2), (width, height//2), (50, 50, 50), 1)
+    scene.rectangle((20, height-25), (50, height-10), (255, 0, 0), -1)
+    scene.rectangle((60, height-25), (90, height-10), (0, 255, 0), -1)
+    scene.rectangle((100, height-25), (130, height-10), (0, 0, 255), -1)
+    scene.circle((width-20, 20), 8, (255, 0, 255), 2)
+    scene.line((0, 0), (50, 50), (128, 128, 0), 2)
+    scene.circle((int(ball_x), int(ball_y)), ball_radius, ball_color, -1, name="ball")
+    scene.compile()
+    return scene
+
+
+# --- cv_bounce2.py 메인 루프와 같은 공 이동 로직으로 프레임별 공 위치를 미리 계산 ---
+ball_x = width / 2.0
+ball_y = height / 2.0
+ball_speed_x = 4.0
+ball_speed_y = 3.0
+positions = []
+for frame in range(n_frames):
+    ball_x += ball_speed_x
+    ball_y += ball_speed_y
+    if ball_x >= (width - ball_radius) or ball_x <= ball_radius:
+        ball_speed_x *= -1.0
+    if ball_y >= (height - ball_radius) or ball_y <= ball_radius:
+        ball_speed_y *= -1.0
+    positions.append((ball_x, ball_y))
+
+# --- 1. 픽셀 비교 ---
+scene = build_scene(width / 2.0, height / 2.0)
+failed = 0
+for frame, (ball_x, ball_y) in enumerate(positions):
+    scene.update("ball", center=(int(ball_x), int(ball_y)))
+    diff = np.count_nonzero((scene.render() != full_redraw(ball_x, ball_y)).any(axis=-1))
+    if diff:
+        print(f"frame {frame}: {diff} pixels differ")
+        failed += 1
+
+if failed:
+    print(f"FAIL: {failed}/{n_frames} frames differ from full redraw")
+    sys.exit(1)
+print(f"OK: {n_frames} frames match full redraw")
+
+# --- 2. 겹치는 동적 도형 몇 개만 바뀌는 장면 (부분 복원 경로) 픽셀 비교 ---
+rng = np.random.default_rng(0)
+shapes = []   # [(kind, params)] 추가 순서대로
+overlap = DisplayList(width, height)
+overlap.rectangle((0, 40), (width, 56), (80, 80, 80), -1)
+for i in range(12):
+    x, y = int(rng.integers(width)), int(rng.integers(height))
+    color = tuple(int(c) for c in rng.integers(256, size=3))
+    if i % 3 == 0:
+        params = dict(pt1=(x, y), pt2=(x + 30, y + 20), color=color, thickness=-1)
+        overlap.rectangle(**params, name=i)
+        shapes.append(("rectangle", params))
+    else:
+        params = dict(center=(x, y), radius=int(rng.integers(4, 16)), color=color, thickness=-1,
+                      line_type=cv2.LINE_AA if i % 3 == 1 else cv2.LINE_8)
+        overlap.circle(**params, name=i)
+        shapes.append(("circle", params))
+
+failed = 0
+for frame in range(n_frames):
+    i = int(rng.integers(len(shapes)))
+    kind, params = shapes[i]
+    key = "pt1" if kind == "rectangle" else "center"
+    dx, dy = (int(v) for v in rng.integers(-6, 7, size=2))
+    moved = (params[key][0] + dx, params[key][1] + dy)
+    changes = {key: moved}
+    if kind == "rectangle":
+        changes["pt2"] = (moved[0] + 30, moved[1] + 20)
+    params.update(changes)
+    overlap.update(i, **changes)
+
+    expected = np.zeros((height, width, 3), dtype=np.uint8)
+    cv2.rectangle(expected, (0, 40), (width, 56), (80, 80, 80), -1)
+    for kind, params in shapes:
+        if kind == "rectangle":
+            cv2.rectangle(expected, params["pt1"], params["pt2"], params["color"], -1)
+        else:
+            cv2.circle(expected, params["center"], params["radius"], params["color"], -1,
+                       params["line_type"])
+    diff = np.count_nonzero((overlap.render() != expected).any(axis=-1))
+    if diff:
+        print(f"overlap frame {frame}: {diff} pixels differ")
+        failed += 1
+
+if failed:
+    print(f"FAIL: {failed}/{n_frames} overlap frames differ from sequential cv2 calls")
+    sys.exit(1)
+print(f"OK: {n_frames} overlap frames match sequential cv2 calls")
+
+# --- 3. 프레임당 시간 비교 (여러 번 재서 가장 빠른 값 사용) ---
+def per_frame_us(draw_frame):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for ball_x, ball_y in positions:
+            draw_frame(ball_x, ball_y)
+        best = min(best, time.perf_counter() - start)
+    return best / n_frames * 1e6
+
+def display_list_frame(ball_x, ball_y):
+    scene.update("ball", center=(int(ball_x), int(ball_y)))
+    return scene.render()
+
+full_us = per_frame_us(full_redraw)
+scene_us = per_frame_us(display_list_frame)
+print(f"full redraw: {full_us:.1f} us/frame, display list: {scene_us:.1f} us/frame")
+if scene_us >= full_us:
+    print("FAIL: display list is not faster than full redraw")
+    sys.exit(1)
+print(f"OK: display list is {full_us / scene_us:.1f}x faster")
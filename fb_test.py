@@ -7,7 +7,8 @@ import click
 import numpy as np
 
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
-from adafruit_blinka_raspberry_pi5_piomatter.pixelmappers import simple_multilane_mapper
+
+import startup_cache
 
 # --- 1. 사용자님의 '기본 소스'에서 가져온 하드웨어 설정 ---
 panel_width = 64
@@ -63,7 +64,7 @@ def apply_rotation_fix_numpy(source_array, lane_height, num_lanes):
     return corrected_array
 
 # --- 5. PioMatter 객체 설정 (하드코딩된 값 사용) ---
-pixelmap = simple_multilane_mapper(width, height, n_addr_lines, n_lanes_for_mapper)
+pixelmap = startup_cache.pixelmap(width, height, n_addr_lines, n_lanes_for_mapper).tolist()
 geometry = piomatter.Geometry(width=width, height=height, n_addr_lines=n_addr_lines, n_planes=10, n_temporal_planes=4, map=pixelmap, n_lanes=n_lanes_for_mapper)
 # 이 스크립트는 RGB565를 사용하므로, framebuffer의 dtype도 uint16이어야 합니다.
 framebuffer = np.zeros(shape=(geometry.height, geometry.width), dtype=np.uint16)
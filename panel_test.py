@@ -6,7 +6,7 @@ import numpy as np
 from PIL import Image
 import cv2
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
-from adafruit_blinka_raspberry_pi5_piomatter.pixelmappers import simple_multilane_mapper
+import startup_cache
 
 # --- 하드웨어 설정 ---
 panel_width = 64
@@ -65,7 +65,7 @@ def draw_rotating_icon(canvas, center_x, center_y, big_radius, sun_radius, angle
         cv2.line(canvas, (x1, y1), (x2, y2), (255, 255, 255), thickness, cv2.LINE_AA)
 
 # --- PioMatter 매트릭스 초기화 ---
-pixelmap = simple_multilane_mapper(width, height, n_addr_lines, n_lanes_for_mapper)
+pixelmap = startup_cache.pixelmap(width, height, n_addr_lines, n_lanes_for_mapper).tolist()
 geometry = piomatter.Geometry(
     width=width, 
     height=height, 
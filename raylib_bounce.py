@@ -7,7 +7,8 @@ from PIL import Image
 from raylib.static import raylib
 
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
-from adafruit_blinka_raspberry_pi5_piomatter.pixelmappers import simple_multilane_mapper
+
+import startup_cache
 
 # --- 하드웨어 설정 (이전과 동일) ---
 panel_width = 64
@@ -31,7 +32,7 @@ def apply_rotation_fix(original_image, lane_height, num_lanes):
     return corrected_img
 
 # --- PioMatter 매트릭스 초기화 (이전과 동일) ---
-pixelmap = simple_multilane_mapper(width, height, n_addr_lines, n_lanes_for_mapper)
+pixelmap = startup_cache.pixelmap(width, height, n_addr_lines, n_lanes_for_mapper).tolist()
 geometry = piomatter.Geometry(width=width, height=height, n_addr_lines=n_addr_lines, n_planes=10, n_temporal_planes=4, map=pixelmap, n_lanes=n_lanes_for_mapper)
 framebuffer = np.zeros(shape=(height, width, 3), dtype=np.uint8)
 matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed, pinout=piomatter.Pinout.Active3, framebuffer=framebuffer, geometry=geometry)
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""
+시작할 때마다 다시 계산하던 테이블(현재는 simple_multilane_mapper 픽셀맵)을
+디스크에 .npy로 저장해두고 다음 실행부터는 mmap_mode로 바로 읽어오는 캐시.
+만드는 데 몇 ms도 안 걸리는 테이블은 해시/파일 읽기 비용이 더 크므로 캐시하지 않습니다.
+
+- 캐시 키는 CACHE_VERSION + 이름 + 파라미터(지오메트리/색상 등)의 해시입니다.
+  파라미터가 바뀌면 키가 달라지므로 새로 계산합니다. 테이블을 만드는 라이브러리의 버전도
+  파라미터에 넣어서, 라이브러리를 업그레이드하면 예전 결과를 쓰지 않게 합니다.
+- 새로 만들면 같은 이름의 예전 파일({name}-<16자리 hex>.npy)은 지웁니다.
+  테이블을 만드는 방식이 바뀌면 CACHE_VERSION을 올려서 기존 캐시를 모두 무효화합니다.
+- 저장 위치는 기본 ~/.cache/inv_eyes 이며 INV_EYES_CACHE_DIR 환경변수로 바꿀 수 있습니다.
+"""
+import hashlib
+import importlib.metadata
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+CACHE_VERSION = 1
+CACHE_DIR = Path(os.environ.get("INV_EYES_CACHE_DIR", Path.home() / ".cache" / "inv_eyes"))
+
+
+def cached_array(name, params, builder):
+    """
+    캐시된 배열을 읽기 전용 memmap으로 돌려줍니다. 없거나 깨져 있으면 builder()로 만들어 저장합니다.
+
+    Args:
+        name: 캐시 파일 이름 접두사 (예: "pixelmap")
+        params: 결과를 결정하는 모든 값 (JSON으로 직렬화 가능해야 함, numpy 스칼라/배열 허용)
+        builder: 인자 없이 호출하면 numpy 배열을 돌려주는 함수
+    """
+    blob = json.dumps({"version": CACHE_VERSION, "name": name, "params": params},
+                      sort_keys=True, default=_jsonable)
+    key = hashlib.sha256(blob.encode()).hexdigest()[:16]
+    path = CACHE_DIR / f"{name}-{key}.npy"
+
+    if path.exists():
+        try:
+            return np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            pass  # 중간에 끊긴 파일 등은 새로 만듭니다.
+
+    array = np.ascontiguousarray(builder())
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체합니다.
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            np.save(f, array)
+        os.replace(tmp_name, path)
+    except OSError:
+        # 캐시 디렉터리에 쓸 수 없으면 임시 파일을 치우고 캐시 없이 진행
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        return array
+
+    # 정확히 "{name}-<16자리 hex>.npy" 인 파일만 지워서 "scene"이 "scene-b" 등을 건드리지 않게 합니다.
+    stale_pattern = re.compile(re.escape(name) + r"-[0-9a-f]{16}\.npy")
+    for stale in CACHE_DIR.glob(f"{name}-*.npy"):
+        if stale != path and stale_pattern.fullmatch(stale.name):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return array  # 그 사이 다른 프로세스가 지웠으면 메모리의 배열을 그대로 사용
+
+
+def _jsonable(value):
+    # numpy 스칼라/배열은 파이썬 기본 타입으로 바꿔서 해시합니다. (np.int64(1)과 1은 같은 키)
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# --- 자주 쓰는 테이블 ---
+def pixelmap(width, height, n_addr_lines, n_lanes):
+    """simple_multilane_mapper 결과를 int32 배열로 캐시합니다. (Geometry에는 .tolist()로 전달)"""
+    def build():
+        from adafruit_blinka_raspberry_pi5_piomatter.pixelmappers import simple_multilane_mapper
+        return np.asarray(simple_multilane_mapper(width, height, n_addr_lines, n_lanes), dtype=np.int32)
+
+    params = dict(width=width, height=height, n_addr_lines=n_addr_lines, n_lanes=n_lanes,
+                  piomatter=_piomatter_version())
+    return cached_array("pixelmap", params, build)
+
+
+def _piomatter_version():
+    # 배포 메타데이터 없이 import만 되는 경우(소스 트리 빌드, PYTHONPATH)에도 죽지 않도록
+    try:
+        return importlib.metadata.version("adafruit-blinka-raspberry-pi5-piomatter")
+    except importlib.metadata.PackageNotFoundError:
+        import adafruit_blinka_raspberry_pi5_piomatter as piomatter
+        return getattr(piomatter, "__version__", "unknown")
+
@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""
+startup_cache 검증용 스크립트 (매트릭스 하드웨어 없이 실행 가능).
+
+INV_EYES_CACHE_DIR를 임시 디렉터리로 돌려놓고 cached_array를 확인합니다.
+- 처음엔 builder로 만들고, 두 번째부터는 builder 없이 디스크에서 읽는지
+- 파라미터가 바뀌면 새로 만들고 예전 파일은 지우는지
+- "scene"을 다시 만들어도 "scene-b" 캐시는 남아 있는지
+- 쓰기에 실패해도 *.tmp 파일이 남지 않는지
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+cache_dir = tempfile.mkdtemp(prefix="inv_eyes_cache_")
+os.environ["INV_EYES_CACHE_DIR"] = cache_dir
+
+import numpy as np
+
+import startup_cache
+
+failed = 0
+
+
+def check(ok, message):
+    global failed
+    print(("OK: " if ok else "FAIL: ") + message)
+    if not ok:
+        failed += 1
+
+
+def builder(value, calls):
+    def build():
+        calls.append(value)
+        return np.full(4, value, dtype=np.int32)
+    return build
+
+
+def cache_files(suffix=".npy"):
+    return sorted(f for f in os.listdir(cache_dir) if f.endswith(suffix))
+
+
+# --- 1. 처음엔 만들고, 다음엔 디스크에서 읽기 ---
+calls = []
+cold = startup_cache.cached_array("table", {"size": 4}, builder(1, calls))
+warm = startup_cache.cached_array("table", {"size": 4}, builder(1, calls))
+check(calls == [1], "cold load builds once, warm load skips the builder")
+check(isinstance(warm, np.memmap) and warm.tolist() == [1, 1, 1, 1], "warm load is a memmap with the saved values")
+
+# --- 2. 파라미터가 바뀌면 새로 만들고 예전 파일은 지우기 ---
+calls = []
+changed = startup_cache.cached_array("table", {"size": 5}, builder(2, calls))
+check(calls == [2] and changed.tolist() == [2, 2, 2, 2], "changed params rebuild the table")
+check(len([f for f in cache_files() if f.startswith("table-")]) == 1, "stale entry for old params is removed")
+
+# numpy 스칼라가 섞인 파라미터도 같은 키로 해시되어야 함
+calls = []
+startup_cache.cached_array("table", {"size": np.int64(5)}, builder(3, calls))
+check(calls == [], "numpy scalar params hash the same as plain ints")
+
+# --- 3. "scene"을 다시 만들어도 "scene-b"는 남아 있기 ---
+startup_cache.cached_array("scene-b", {"v": 1}, builder(4, []))
+startup_cache.cached_array("scene", {"v": 1}, builder(5, []))
+startup_cache.cached_array("scene", {"v": 2}, builder(6, []))
+check(any(f.startswith("scene-b-") for f in cache_files()), "rebuilding 'scene' keeps the 'scene-b' entry")
+
+# --- 4. 쓰기 실패 시 *.tmp 파일이 남지 않기 ---
+real_save = np.save
+
+
+def failing_save(*args, **kwargs):
+    raise OSError("simulated write failure")
+
+
+np.save = failing_save
+try:
+    fallback = startup_cache.cached_array("broken", {}, builder(7, []))
+finally:
+    np.save = real_save
+check(fallback.tolist() == [7, 7, 7, 7], "failed write falls back to the in-memory array")
+check(cache_files(".tmp") == [], "failed write leaves no *.tmp file")
+
+if failed:
+    print(f"FAIL: {failed} check(s) failed (cache dir: {cache_dir})")
+    sys.exit(1)
+shutil.rmtree(cache_dir)
+print("OK: all startup_cache checks passed")
@@ -7,8 +7,8 @@ import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
-# Your library only has this one mapper, so we will use it.
-from adafruit_blinka_raspberry_pi5_piomatter.pixelmappers import simple_multilane_mapper
+# Your library only has this one mapper, so we will use it (cached on disk by startup_cache).
+import startup_cache
 
 # --- 1. Define physical hardware layout ---
 panel_width = 64
@@ -32,7 +32,7 @@ draw = ImageDraw.Draw(canvas)
 
 # ★★★★★ 이 부분이 핵심입니다 ★★★★★
 # We pass the "fake" number of lanes (6) to the mapper so its internal check passes.
-pixelmap = simple_multilane_mapper(width, height, n_addr_lines, n_lanes_for_mapper)
+pixelmap = startup_cache.pixelmap(width, height, n_addr_lines, n_lanes_for_mapper).tolist()
 
 
 # --- 5. PioMatter 객체 설정 ---